@@ -16,6 +16,22 @@ from typing import Dict, List, Optional, Any, Tuple
 import base64
 import struct
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def sha256_file(file_path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Generate SHA256 hash of a file without reading it into memory"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 
 class MerkleTree:
     """Simple Merkle tree implementation for data integrity proofs"""
@@ -83,10 +99,14 @@ class MerkleTree:
         return proof
 
     def verify_proof(
-        self, block_data: str, block_index: int, proof: List[Dict[str, Any]]
+        self,
+        block_data: str,
+        block_index: int,
+        proof: List[Dict[str, Any]],
+        leaf_hash: Optional[str] = None,
     ) -> bool:
-        """Verify a Merkle proof"""
-        current_hash = self.sha256(block_data)
+        """Verify a Merkle proof (leaf_hash skips re-hashing a known block)"""
+        current_hash = leaf_hash if leaf_hash is not None else self.sha256(block_data)
 
         for proof_element in proof:
             sibling_hash = proof_element["hash"]
@@ -212,6 +232,8 @@ class CapsuleManager:
             return None
 
         try:
+            if ORJSON_AVAILABLE:
+                return orjson.loads(capsule_file.read_bytes())
             with open(capsule_file, "r") as f:
                 return json.load(f)
         except Exception as e:
@@ -226,6 +248,12 @@ class CapsuleManager:
         if not capsule:
             return None
 
+        return self._read_verified_content(capsule_id, capsule)
+
+    def _read_verified_content(
+        self, capsule_id: str, capsule: Dict[str, Any]
+    ) -> Optional[str]:
+        """Read capsule content, returning None unless it matches content_hash"""
         content_file = Path(capsule.get("content_file", ""))
         if not content_file.exists():
             return None
@@ -235,13 +263,14 @@ class CapsuleManager:
                 content = f.read()
 
             # Verify content integrity
-            if self.sha256(content) != capsule["content_hash"]:
+            actual_hash = self.sha256(content)
+            if actual_hash != capsule["content_hash"]:
                 self.log_integrity_event(
                     capsule_id,
                     "CONTENT_INTEGRITY_VIOLATION",
                     {
                         "expected_hash": capsule["content_hash"],
-                        "actual_hash": self.sha256(content),
+                        "actual_hash": actual_hash,
                     },
                 )
                 return None
@@ -260,7 +289,8 @@ class CapsuleManager:
         if not capsule:
             return {"error": "Capsule not found"}
 
-        content = self.get_capsule_content(capsule_id)
+        # Content is hashed once here; a mismatch means no content is returned
+        content = self._read_verified_content(capsule_id, capsule)
         if content is None:
             return {"error": "Could not read capsule content"}
 
@@ -277,11 +307,7 @@ class CapsuleManager:
             "overall_valid": False,
         }
 
-        # Verify content hash
-        actual_content_hash = self.sha256(content)
-        verification_result["content_hash_valid"] = (
-            actual_content_hash == capsule["content_hash"]
-        )
+        verification_result["content_hash_valid"] = True
 
         # Verify Merkle tree
         content_blocks = self.split_content_to_blocks(content, block_size=1024)
@@ -292,14 +318,18 @@ class CapsuleManager:
             merkle_tree.root_hash == capsule["merkle_root"]
         )
 
-        # Verify individual blocks with their proofs
+        # Verify individual blocks with their proofs, reusing the leaf hashes
+        # computed while rebuilding the tree
+        leaf_hashes = merkle_tree.tree_levels[0] if merkle_tree.tree_levels else []
         for block_key, proof_data in capsule["merkle_proofs"].items():
             block_index = proof_data["block_index"]
             if block_index < len(content_blocks):
                 block_data = content_blocks[block_index]
                 proof = proof_data["proof"]
 
-                if merkle_tree.verify_proof(block_data, block_index, proof):
+                if merkle_tree.verify_proof(
+                    block_data, block_index, proof, leaf_hashes[block_index]
+                ):
                     verification_result["merkle_verification"]["blocks_verified"] += 1
                 else:
                     verification_result["merkle_verification"]["blocks_failed"] += 1
@@ -403,11 +433,7 @@ class CapsuleManager:
             archive_info["total_size"] = archive_file.stat().st_size
 
             # Calculate archive hash
-            with open(archive_file, "rb") as f:
-                archive_content = f.read()
-                archive_info["archive_hash"] = hashlib.sha256(
-                    archive_content
-                ).hexdigest()
+            archive_info["archive_hash"] = sha256_file(archive_file)
 
             archive_info["archive_file"] = str(archive_file)
             archive_info["status"] = "completed"
@@ -4,17 +4,28 @@ Ceiling Dashboard - Real-time web interface for monitoring ceiling performance
 Provides visual analytics and management interface for EPOCH5 ceiling system
 """
 
+import gzip
 import json
+import hashlib
 import os
+import time
+from collections import deque
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 # Simple HTTP server for the dashboard
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 import threading
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     from ceiling_manager import CeilingManager, ServiceTier, CeilingType
     from integration import EPOCH5Integration
@@ -23,11 +34,39 @@ try:
 except ImportError:
     CEILING_AVAILABLE = False
 
+PERFORMANCE_HISTORY_SIZE = 50
+GZIP_MIN_SIZE = 1024  # Smaller bodies are not worth compressing
+
+
+def parse_performance_events(lines) -> List[Dict[str, Any]]:
+    """Extract dynamic adjustment entries from ceiling event log lines"""
+    performance_data = []
+    for line in lines:
+        if line.strip():
+            event = orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+            if event.get("event_type") == "DYNAMIC_ADJUSTMENT":
+                performance_data.append(
+                    {
+                        "timestamp": event["timestamp"],
+                        "config_id": event["data"]["config_id"],
+                        "performance_score": event["data"]["performance_score"],
+                        "adjustments": event["data"]["adjustments"],
+                    }
+                )
+    return performance_data
+
 
 class CeilingDashboardHandler(BaseHTTPRequestHandler):
-    def __init__(self, *args, ceiling_manager=None, integration=None, **kwargs):
+    # Encoded page, its gzip form and digest; the HTML is static so it is
+    # built once per process
+    _dashboard_page = None
+
+    def __init__(
+        self, *args, ceiling_manager=None, integration=None, dashboard=None, **kwargs
+    ):
         self.ceiling_manager = ceiling_manager
         self.integration = integration
+        self.dashboard = dashboard
         super().__init__(*args, **kwargs)
 
     def do_GET(self):
@@ -43,83 +82,139 @@ class CeilingDashboardHandler(BaseHTTPRequestHandler):
             self.serve_api_ceilings()
         elif path == "/api/performance":
             self.serve_api_performance()
+        elif path == "/api/dashboard":
+            self.serve_api_dashboard()
         else:
             self.send_error(404, "Endpoint not found")
 
     def serve_dashboard(self):
         """Serve the main dashboard HTML"""
-        html = self.generate_dashboard_html()
-        self.send_response(200)
-        self.send_header("Content-type", "text/html")
-        self.end_headers()
-        self.wfile.write(html.encode())
+        page = type(self)._dashboard_page
+        if page is None:
+            body = self.generate_dashboard_html().encode()
+            page = (
+                body,
+                gzip.compress(body, compresslevel=9),
+                hashlib.sha256(body).hexdigest()[:32],
+            )
+            type(self)._dashboard_page = page
+
+        body, gzipped, digest = page
+        self.send_body(body, "text/html", gzipped=gzipped, digest=digest, cors=False)
 
     def serve_api_status(self):
         """Serve system status API"""
-        if not self.integration:
-            self.send_json_response({"error": "Integration not available"})
-            return
-
-        status = self.integration.get_system_status()
-        self.send_json_response(status)
+        self.send_json_response(self.get_status_data())
 
     def serve_api_ceilings(self):
         """Serve ceiling configurations API"""
+        self.send_json_response(self.get_ceilings_data())
+
+    def serve_api_performance(self):
+        """Serve performance history API"""
+        self.send_json_response(self.get_performance_data())
+
+    def serve_api_dashboard(self):
+        """Serve status, ceilings and performance in a single response"""
+        self.send_json_response(
+            {
+                "status": self.get_status_data(),
+                "ceilings": self.get_ceilings_data(),
+                "performance": self.get_performance_data(),
+            }
+        )
+
+    def get_status_data(self) -> Dict[str, Any]:
+        """Build the system status payload"""
+        if not self.integration:
+            return {"error": "Integration not available"}
+
+        if self.dashboard:
+            return self.dashboard.get_system_status()
+        return self.integration.get_system_status()
+
+    def get_ceilings_data(self) -> Dict[str, Any]:
+        """Build the ceiling configurations payload"""
         if not self.ceiling_manager:
-            self.send_json_response({"error": "Ceiling manager not available"})
-            return
+            return {"error": "Ceiling manager not available"}
 
         ceilings_data = self.ceiling_manager.load_ceilings()
         service_tiers = self.ceiling_manager.load_service_tiers()
 
-        response = {
+        return {
             "configurations": ceilings_data.get("configurations", {}),
             "service_tiers": service_tiers.get("tiers", {}),
             "last_updated": ceilings_data.get("last_updated", ""),
         }
-        self.send_json_response(response)
 
-    def serve_api_performance(self):
-        """Serve performance history API"""
+    def get_performance_data(self):
+        """Build the performance history payload (last 50 adjustments)"""
         if not self.ceiling_manager:
-            self.send_json_response({"error": "Ceiling manager not available"})
-            return
+            return {"error": "Ceiling manager not available"}
 
-        # Load performance history from ceiling events log
-        performance_data = []
-        events_log = self.ceiling_manager.ceiling_events_log
+        try:
+            if self.dashboard:
+                return self.dashboard.get_performance_history()
 
-        if events_log.exists():
-            try:
-                with open(events_log, "r") as f:
-                    for line in f:
-                        if line.strip():
-                            event = json.loads(line)
-                            if event.get("event_type") == "DYNAMIC_ADJUSTMENT":
-                                performance_data.append(
-                                    {
-                                        "timestamp": event["timestamp"],
-                                        "config_id": event["data"]["config_id"],
-                                        "performance_score": event["data"][
-                                            "performance_score"
-                                        ],
-                                        "adjustments": event["data"]["adjustments"],
-                                    }
-                                )
-            except Exception as e:
-                performance_data = [
-                    {"error": f"Failed to load performance data: {str(e)}"}
-                ]
+            # Load performance history from ceiling events log
+            events_log = self.ceiling_manager.ceiling_events_log
+            if not events_log.exists():
+                return []
+            with open(events_log, "r") as f:
+                performance_data = parse_performance_events(f)
+        except Exception as e:
+            return [{"error": f"Failed to load performance data: {str(e)}"}]
 
-        self.send_json_response(performance_data[-50:])  # Return last 50 entries
+        return performance_data[-PERFORMANCE_HISTORY_SIZE:]
 
     def send_json_response(self, data: Dict[str, Any]):
         """Send JSON response"""
+        if ORJSON_AVAILABLE:
+            body = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        else:
+            body = json.dumps(data, separators=(",", ":")).encode()
+
+        self.send_body(body, "application/json")
+
+    def send_body(
+        self,
+        body: bytes,
+        content_type: str,
+        gzipped: Optional[bytes] = None,
+        digest: Optional[str] = None,
+        cors: bool = True,
+    ):
+        """Send a response body with ETag revalidation and optional gzip"""
+        # Polling clients revalidate with If-None-Match; unchanged data costs a 304
+        if digest is None:
+            digest = hashlib.sha256(body).hexdigest()[:32]
+        use_gzip = len(body) >= GZIP_MIN_SIZE and "gzip" in self.headers.get(
+            "Accept-Encoding", ""
+        )
+        etag = f'"{digest}-gzip"' if use_gzip else f'"{digest}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return
+
+        if use_gzip:
+            body = gzipped or gzip.compress(body, compresslevel=6)
+
         self.send_response(200)
-        self.send_header("Content-type", "application/json")
-        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Content-type", content_type)
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        if cors:
+            self.send_header("Access-Control-Allow-Origin", "*")
         self.end_headers()
-        self.wfile.write(json.dumps(data, indent=2).encode())
+        self.wfile.write(body)
 
     def generate_dashboard_html(self):
         """Generate the dashboard HTML"""
@@ -354,18 +449,20 @@ class CeilingDashboardHandler(BaseHTTPRequestHandler):
         
         async function refreshAll() {
             secondsLeft = 30;
-            await Promise.all([
-                loadSystemMetrics(),
-                loadServiceTiers(),
-                loadPerformanceData()
-            ]);
+            let data;
+            try {
+                const response = await fetch('/api/dashboard');
+                data = await response.json();
+            } catch (error) {
+                data = {status: {error: error.message}, ceilings: {error: error.message}, performance: {error: error.message}};
+            }
+            loadSystemMetrics(data.status);
+            loadServiceTiers(data.ceilings);
+            loadPerformanceData(data.performance);
         }
         
-        async function loadSystemMetrics() {
+        function loadSystemMetrics(data) {
             try {
-                const response = await fetch('/api/status');
-                const data = await response.json();
-                
                 if (data.error) {
                     throw new Error(data.error);
                 }
@@ -414,11 +511,8 @@ class CeilingDashboardHandler(BaseHTTPRequestHandler):
             document.getElementById('metricsGrid').innerHTML = html;
         }
         
-        async function loadServiceTiers() {
+        function loadServiceTiers(data) {
             try {
-                const response = await fetch('/api/ceilings');
-                const data = await response.json();
-                
                 if (data.error) {
                     throw new Error(data.error);
                 }
@@ -466,10 +560,11 @@ class CeilingDashboardHandler(BaseHTTPRequestHandler):
             document.getElementById('tiersContainer').innerHTML = html;
         }
         
-        async function loadPerformanceData() {
+        function loadPerformanceData(data) {
             try {
-                const response = await fetch('/api/performance');
-                const data = await response.json();
+                if (data.error) {
+                    throw new Error(data.error);
+                }
                 
                 if (Array.isArray(data) && data.length > 0) {
                     displayPerformanceChart(data);
@@ -508,28 +603,132 @@ class CeilingDashboardHandler(BaseHTTPRequestHandler):
 
 
 class CeilingDashboard:
-    def __init__(self, base_dir: str = "./archive/EPOCH5", port: int = 8080):
+    def __init__(
+        self,
+        base_dir: str = "./archive/EPOCH5",
+        port: int = 8080,
+        status_ttl: float = 5.0,
+        refresh_interval: Optional[float] = None,
+    ):
         self.base_dir = base_dir
         self.port = port
         self.ceiling_manager = None
         self.integration = None
 
+        # System status walks every component store; reuse it across requests
+        self.status_ttl = status_ttl
+        self._status_cache = None  # (expires_at, status)
+
+        # Tail of the ceiling events log; only bytes appended since the last
+        # request are read and parsed
+        self._performance_tail = deque(maxlen=PERFORMANCE_HISTORY_SIZE)
+        self._events_offset = 0
+        self._tail_lock = threading.Lock()
+
+        # Optional background thread that keeps both snapshots warm so
+        # requests never pay for the rebuild
+        self.refresh_interval = refresh_interval
+        self._refresher = None
+        self._stop_refresh = threading.Event()
+
         if CEILING_AVAILABLE:
             self.ceiling_manager = CeilingManager(base_dir)
             self.integration = EPOCH5Integration(base_dir)
 
-    def start_server(self):
-        """Start the dashboard web server"""
+    def get_system_status(self) -> Dict[str, Any]:
+        """Get system status, reusing the last snapshot while it is fresh"""
+        now = time.monotonic()
+        cached = self._status_cache
+        if cached and now < cached[0]:
+            return cached[1]
+
+        status = self.integration.get_system_status()
+        self._status_cache = (now + self.status_ttl, status)
+        return status
+
+    def refresh_snapshots(self):
+        """Rebuild the status snapshot and pull new events into the tail"""
+        status = self.integration.get_system_status()
+        # Outlive the refresh period; if the refresher stalls, requests recompute
+        self._status_cache = (
+            time.monotonic() + max(self.status_ttl, 2 * self.refresh_interval),
+            status,
+        )
+        self.get_performance_history()
+
+    def _refresh_loop(self):
+        """Background loop for refresh_snapshots"""
+        while not self._stop_refresh.is_set():
+            try:
+                self.refresh_snapshots()
+            except Exception as e:
+                print(f"⚠️  Dashboard refresh failed: {e}")
+            self._stop_refresh.wait(self.refresh_interval)
+
+    def start_refresher(self):
+        """Start the background snapshot refresher if configured"""
+        if not self.refresh_interval or not self.integration:
+            return
+        if self._refresher and self._refresher.is_alive():
+            return
+
+        self._stop_refresh.clear()
+        self._refresher = threading.Thread(
+            target=self._refresh_loop, name="dashboard-refresh", daemon=True
+        )
+        self._refresher.start()
+
+    def stop_refresher(self):
+        """Stop the background snapshot refresher"""
+        self._stop_refresh.set()
+        if self._refresher:
+            self._refresher.join()
+            self._refresher = None
+
+    def get_performance_history(self) -> List[Dict[str, Any]]:
+        """Get recent dynamic adjustments, reading only new event log lines"""
+        events_log = self.ceiling_manager.ceiling_events_log
+
+        with self._tail_lock:
+            if not events_log.exists():
+                return list(self._performance_tail)
+
+            if events_log.stat().st_size < self._events_offset:
+                # Log was truncated or rotated; start over
+                self._events_offset = 0
+                self._performance_tail.clear()
+
+            with open(events_log, "rb") as f:
+                f.seek(self._events_offset)
+                chunk = f.read()
+
+            # Leave a partially written last line for the next read
+            end = chunk.rfind(b"\n") + 1
+            self._performance_tail.extend(
+                parse_performance_events(chunk[:end].splitlines())
+            )
+            self._events_offset += end
+            return list(self._performance_tail)
+
+    def make_server(self) -> ThreadingHTTPServer:
+        """Create the dashboard HTTP server (one thread per request)"""
 
         def handler(*args, **kwargs):
             return CeilingDashboardHandler(
                 *args,
                 ceiling_manager=self.ceiling_manager,
                 integration=self.integration,
+                dashboard=self,
                 **kwargs,
             )
 
-        httpd = HTTPServer(("localhost", self.port), handler)
+        # Slow status builds or stalled clients must not block other pollers
+        return ThreadingHTTPServer(("localhost", self.port), handler)
+
+    def start_server(self):
+        """Start the dashboard web server"""
+        httpd = self.make_server()
+        self.start_refresher()
         print(f"🌐 EPOCH5 Ceiling Dashboard starting on http://localhost:{self.port}")
         print(f"📊 Real-time ceiling monitoring and analytics available")
         print(f"💰 Service tier revenue optimization dashboard")
@@ -539,6 +738,7 @@ class CeilingDashboard:
             httpd.serve_forever()
         except KeyboardInterrupt:
             print("\n🛑 Dashboard server stopped")
+            self.stop_refresher()
             httpd.server_close()
 
 
@@ -546,6 +746,14 @@ def main():
     """CLI interface for ceiling dashboard"""
     import argparse
 
+    def positive_seconds(value: str) -> float:
+        """Parse a finite interval greater than zero"""
+        seconds = float(value)
+        # A zero or negative wait returns at once and the refresher would spin
+        if not 0 < seconds < float("inf"):
+            raise argparse.ArgumentTypeError(f"must be a positive number: {value}")
+        return seconds
+
     parser = argparse.ArgumentParser(description="EPOCH5 Ceiling Dashboard")
     parser.add_argument(
         "--port", type=int, default=8080, help="Port to run the dashboard on"
@@ -553,6 +761,11 @@ def main():
     parser.add_argument(
         "--base-dir", default="./archive/EPOCH5", help="Base directory for EPOCH5 data"
     )
+    parser.add_argument(
+        "--refresh-interval",
+        type=positive_seconds,
+        help="Refresh dashboard data in the background every N seconds",
+    )
 
     args = parser.parse_args()
 
@@ -563,7 +776,9 @@ def main():
         )
         return
 
-    dashboard = CeilingDashboard(args.base_dir, args.port)
+    dashboard = CeilingDashboard(
+        args.base_dir, args.port, refresh_interval=args.refresh_interval
+    )
     dashboard.start_server()
 
 
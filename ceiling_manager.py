@@ -8,6 +8,8 @@ Integrated with EPOCH5 Audit System for secure logging and enforcement
 
 import json
 import hashlib
+import os
+import stat
 import time
 import statistics
 from pathlib import Path
@@ -23,6 +25,32 @@ except ImportError:
     SECURITY_SYSTEM_AVAILABLE = False
 
 
+def write_file_atomic(file_path: Path, data: bytes):
+    """Write bytes to a sibling temp file and swap it into place"""
+    # Readers such as the dashboard never see a half-written file. The temp
+    # file is created like a plain open() would (0o666 less the umask) rather
+    # than with tempfile's 0600
+    tmp_path = file_path.with_name(
+        f"{file_path.name}.{os.getpid()}.{os.urandom(4).hex()}.tmp"
+    )
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # An existing file keeps its mode
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(file_path).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
 class ServiceTier(Enum):
     FREEMIUM = "freemium"
     PROFESSIONAL = "professional"
@@ -66,6 +94,10 @@ class CeilingManager:
         """Generate SHA256 hash consistent with EPOCH5"""
         return hashlib.sha256(data.encode("utf-8")).hexdigest()
 
+    def _write_json_atomic(self, file_path: Path, data: Dict[str, Any]):
+        """Write JSON to a sibling temp file and swap it into place"""
+        write_file_atomic(file_path, json.dumps(data, indent=2).encode("utf-8"))
+
     def _initialize_default_tiers(self):
         """Initialize default service tier configurations for revenue optimization"""
         default_tiers = {
@@ -141,8 +173,7 @@ class CeilingManager:
     def save_service_tiers(self, tiers_data: Dict[str, Any]):
         """Save service tier configuration"""
         tiers_data["last_updated"] = self.timestamp()
-        with open(self.service_tiers_file, "w") as f:
-            json.dump(tiers_data, f, indent=2)
+        self._write_json_atomic(self.service_tiers_file, tiers_data)
 
     def load_service_tiers(self) -> Dict[str, Any]:
         """Load service tier configuration"""
@@ -443,8 +474,7 @@ class CeilingManager:
     def save_ceilings(self, ceilings_data: Dict[str, Any]):
         """Save ceiling configurations"""
         ceilings_data["last_updated"] = self.timestamp()
-        with open(self.ceilings_file, "w") as f:
-            json.dump(ceilings_data, f, indent=2)
+        self._write_json_atomic(self.ceilings_file, ceilings_data)
 
     def load_ceilings(self) -> Dict[str, Any]:
         """Load ceiling configurations"""
@@ -1,14 +1,29 @@
+import atexit
+import functools
 import logging
 import json
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict
 
+
+def _release(logger, listener, attached, handlers) -> None:
+    """Stop the listener, detach the logger's handlers and close the outputs"""
+    if listener:
+        listener.stop()
+    for handler in attached:
+        logger.removeHandler(handler)
+    for handler in handlers:
+        handler.close()
+
+
 class EnhancedLogger:
     """
     Enhanced logging system with structured output and rotation
     """
-    def __init__(self, name: str, log_dir: Path):
+    def __init__(self, name: str, log_dir: Path, use_queue: bool = False):
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.INFO)
         
@@ -23,12 +38,41 @@ class EnhancedLogger:
             datefmt='%Y-%m-%dT%H:%M:%S%z'
         )
         handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
         
         # Console handler
         console = logging.StreamHandler()
         console.setFormatter(formatter)
-        self.logger.addHandler(console)
+
+        self.listener = None
+        if use_queue:
+            # File and console writes happen on the listener thread; callers
+            # only pay for a queue put
+            log_queue = queue.Queue(-1)
+            self.listener = QueueListener(
+                log_queue, handler, console, respect_handler_level=True
+            )
+            self.listener.start()
+            attached = [QueueHandler(log_queue)]
+        else:
+            attached = [handler, console]
+        for logger_handler in attached:
+            self.logger.addHandler(logger_handler)
+
+        # Bound to the handlers rather than self so the exit hook does not
+        # keep this object alive
+        self._release = functools.partial(
+            _release, self.logger, self.listener, attached, [handler, console]
+        )
+        atexit.register(self._release)
+
+    def close(self) -> None:
+        """Flush queued records, detach from the logger and close the handlers"""
+        if self._release is None:
+            return
+        atexit.unregister(self._release)
+        self._release()
+        self._release = None
+        self.listener = None
     
     def log_event(self, event_type: str, data: Dict[str, Any]) -> None:
         """Log a structured event with metadata"""
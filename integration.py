@@ -8,6 +8,8 @@ Provides unified interface for managing agents, policies, DAGs, cycles, capsules
 import json
 import argparse
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
@@ -348,12 +350,10 @@ class EPOCH5Integration:
         dags = self.dag_manager.load_dags()
         status["components"]["dags"] = {
             "total": len(dags.get("dags", {})),
-            "completed": len(
-                [
-                    d
-                    for d in dags.get("dags", {}).values()
-                    if d.get("status") == "completed"
-                ]
+            "completed": sum(
+                1
+                for d in dags.get("dags", {}).values()
+                if d.get("status") == "completed"
             ),
         }
 
@@ -361,12 +361,10 @@ class EPOCH5Integration:
         cycles = self.cycle_executor.load_cycles()
         status["components"]["cycles"] = {
             "total": len(cycles.get("cycles", {})),
-            "completed": len(
-                [
-                    c
-                    for c in cycles.get("cycles", {}).values()
-                    if c.get("status") == "completed"
-                ]
+            "completed": sum(
+                1
+                for c in cycles.get("cycles", {}).values()
+                if c.get("status") == "completed"
             ),
         }
 
@@ -398,10 +396,11 @@ class EPOCH5Integration:
             )
 
             # Count configurations by tier
-            tier_counts = {}
-            for config in configs.values():
-                tier = config.get("service_tier", "unknown")
-                tier_counts[tier] = tier_counts.get(tier, 0) + 1
+            tier_counts = dict(
+                Counter(
+                    config.get("service_tier", "unknown") for config in configs.values()
+                )
+            )
 
             status["components"]["ceilings"] = {
                 "total_configurations": len(configs),
@@ -443,13 +442,22 @@ class EPOCH5Integration:
             # Validate meta-capsules
             meta_capsules = self.meta_capsule_creator.list_meta_capsules()
             meta_validations = []
+            ledger_index = self.meta_capsule_creator.load_ledger_index()
+
+            # Archive hashing releases the GIL, so verify capsules concurrently
+            with ThreadPoolExecutor() as executor:
+                futures = [
+                    executor.submit(
+                        self.meta_capsule_creator.verify_meta_capsule,
+                        meta_capsule_info["meta_capsule_id"],
+                        ledger_index,
+                    )
+                    for meta_capsule_info in meta_capsules
+                ]
 
-            for meta_capsule_info in meta_capsules:
+            for future in futures:
                 try:
-                    result = self.meta_capsule_creator.verify_meta_capsule(
-                        meta_capsule_info["meta_capsule_id"]
-                    )
-                    meta_validations.append(result)
+                    meta_validations.append(future.result())
                 except Exception as e:
                     validation_results["errors"].append(
                         f"Meta-capsule validation error: {str(e)}"
@@ -481,7 +489,8 @@ class EPOCH5Integration:
         return validation_results
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
+    """CLI entry point; pass argv to run a command in-process"""
     parser = argparse.ArgumentParser(description="EPOCH5 Integration System")
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
@@ -558,7 +567,7 @@ def main():
     )
     oneliner_parser.add_argument("--params", help="JSON parameters for the operation")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Initialize integration system
     integration = EPOCH5Integration()
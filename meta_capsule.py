@@ -7,13 +7,17 @@ Integrates with all EPOCH5 systems for comprehensive state capture
 """
 
 import json
+import gzip
 import hashlib
+import os
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 import zipfile
 import glob
 
+from capsule_metadata import sha256_file
+
 # Import related systems for state capture
 try:
     from agent_management import AgentManager
@@ -52,6 +56,9 @@ class MetaCapsuleCreator:
         self.cycle_executor = CycleExecutor(base_dir) if CycleExecutor else None
         self.capsule_manager = CapsuleManager(base_dir) if CapsuleManager else None
 
+        # (mtime_ns, size, parsed_offset, index) for load_ledger_index
+        self._ledger_index_cache = None
+
     def timestamp(self) -> str:
         """Generate ISO timestamp consistent with EPOCH5"""
         return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -211,6 +218,10 @@ class MetaCapsuleCreator:
 
         # Capture cycle execution state
         if self.cycle_executor:
+            # Fold the write-ahead log into cycles.json and push buffered logs
+            # out so the hashes below cover the live state
+            self.cycle_executor.compact()
+            self.cycle_executor.flush_logs()
             cycles = self.cycle_executor.load_cycles()
             state["systems"]["cycles"] = {
                 "cycles": cycles,
@@ -226,12 +237,14 @@ class MetaCapsuleCreator:
 
             # Hash cycle files
             if (self.base_dir / "cycles").exists():
-                for file_path in (self.base_dir / "cycles").glob("*.json"):
-                    with open(file_path, "r") as f:
-                        content = f.read()
-                        state["file_hashes"][f"cycles/{file_path.name}"] = self.sha256(
-                            content
-                        )
+                cycles_dir = self.base_dir / "cycles"
+                for pattern in ("*.json", "*.jsonl"):
+                    for file_path in cycles_dir.glob(pattern):
+                        with open(file_path, "r") as f:
+                            content = f.read()
+                            state["file_hashes"][f"cycles/{file_path.name}"] = (
+                                self.sha256(content)
+                            )
 
         # Capture capsule and metadata state
         if self.capsule_manager:
@@ -268,6 +281,29 @@ class MetaCapsuleCreator:
 
         return state
 
+    def scan_log_file(self, file_path: Path) -> Dict[str, Any]:
+        """Count, hash and take the last entry of a log in one streaming pass"""
+        digest = hashlib.sha256()
+        first_index = last_index = None
+        last_line = None
+
+        with open(file_path, "r") as f:
+            for index, line in enumerate(f):
+                digest.update(line.encode("utf-8"))
+                if line.strip():
+                    if first_index is None:
+                        first_index = index
+                    last_index = index
+                    last_line = line
+
+        # Blank lines before the first and after the last entry are not counted
+        return {
+            "exists": True,
+            "entries": last_index - first_index + 1 if last_line is not None else 0,
+            "hash": digest.hexdigest(),
+            "last_entry": last_line.strip() if last_line is not None else None,
+        }
+
     def capture_epoch5_base_state(self) -> Dict[str, Any]:
         """Capture state from the original EPOCH5 system"""
         base_state = {
@@ -279,27 +315,14 @@ class MetaCapsuleCreator:
 
         # Check ledger
         if self.ledger_file.exists():
-            with open(self.ledger_file, "r") as f:
-                content = f.read()
-                lines = content.strip().split("\n") if content.strip() else []
-                base_state["ledger"] = {
-                    "exists": True,
-                    "entries": len(lines),
-                    "hash": self.sha256(content),
-                    "last_entry": lines[-1] if lines else None,
-                }
+            base_state["ledger"] = self.scan_log_file(self.ledger_file)
 
         # Check heartbeat
         heartbeat_file = self.base_dir / "heartbeat.log"
         if heartbeat_file.exists():
-            with open(heartbeat_file, "r") as f:
-                content = f.read()
-                lines = content.strip().split("\n") if content.strip() else []
-                base_state["heartbeat"] = {
-                    "exists": True,
-                    "entries": len(lines),
-                    "hash": self.sha256(content),
-                }
+            heartbeat = self.scan_log_file(heartbeat_file)
+            del heartbeat["last_entry"]
+            base_state["heartbeat"] = heartbeat
 
         # Check manifests
         manifests_dir = self.base_dir / "manifests"
@@ -366,10 +389,10 @@ class MetaCapsuleCreator:
         with open(meta_capsule_file, "w") as f:
             json.dump(meta_capsule, f, indent=2)
 
-        # Create state snapshot
-        snapshot_file = self.state_snapshots / f"{meta_capsule_id}_snapshot.json"
-        with open(snapshot_file, "w") as f:
-            json.dump(system_state, f, indent=2)
+        # Create compressed state snapshot (the full state is large and repetitive)
+        snapshot_file = self.state_snapshots / f"{meta_capsule_id}_snapshot.json.gz"
+        with gzip.open(snapshot_file, "wt", encoding="utf-8", compresslevel=6) as f:
+            json.dump(system_state, f, separators=(",", ":"))
 
         # Create archive of all system files
         archive_info = self.create_system_archive(meta_capsule_id)
@@ -404,13 +427,12 @@ class MetaCapsuleCreator:
                 for line_num, line in enumerate(f, 1):
                     line = line.strip()
                     if line and "RECORD_HASH=" in line:
-                        # Parse EPOCH5 ledger entry
-                        parts = line.split("|")
+                        # Parse EPOCH5 ledger entry (single scan per field)
                         entry = {"line_number": line_num, "raw_entry": line}
 
-                        for part in parts:
-                            if "=" in part:
-                                key, value = part.split("=", 1)
+                        for part in line.split("|"):
+                            key, sep, value = part.partition("=")
+                            if sep:
                                 entry[key.lower()] = value
 
                         provenance.append(entry)
@@ -476,10 +498,13 @@ class MetaCapsuleCreator:
                     if dir_path.exists():
                         archive_info["included_directories"].append(dir_name)
 
-                        for file_path in dir_path.rglob("*"):
-                            if file_path.is_file():
+                        # os.walk is scandir-based: file/dir typing comes from
+                        # the directory listing, not a stat() per entry
+                        for root, _dirs, files in os.walk(dir_path):
+                            for file_name in files:
+                                file_path = os.path.join(root, file_name)
                                 arcname = (
-                                    f"{dir_name}/{file_path.relative_to(dir_path)}"
+                                    f"{dir_name}/{os.path.relpath(file_path, dir_path)}"
                                 )
                                 zipf.write(file_path, arcname)
                                 archive_info["file_count"] += 1
@@ -501,11 +526,7 @@ class MetaCapsuleCreator:
             archive_info["total_size"] = archive_file.stat().st_size
 
             # Calculate archive hash
-            with open(archive_file, "rb") as f:
-                archive_content = f.read()
-                archive_info["archive_hash"] = hashlib.sha256(
-                    archive_content
-                ).hexdigest()
+            archive_info["archive_hash"] = sha256_file(archive_file)
 
             archive_info["status"] = "completed"
 
@@ -551,24 +572,26 @@ class MetaCapsuleCreator:
             return "0" * 64  # Genesis hash
 
         try:
+            # Stream the ledger, remembering only the last record line
+            last_record = None
             with open(self.ledger_file, "r") as f:
-                lines = f.readlines()
+                for line in f:
+                    if "RECORD_HASH=" in line:
+                        last_record = line
 
-            # Find the last line with RECORD_HASH
-            for line in reversed(lines):
-                line = line.strip()
-                if "RECORD_HASH=" in line:
-                    parts = line.split("|")
-                    for part in parts:
-                        if part.startswith("RECORD_HASH="):
-                            return part.split("=", 1)[1]
+            if last_record is not None:
+                for part in last_record.strip().split("|"):
+                    if part.startswith("RECORD_HASH="):
+                        return part.split("=", 1)[1]
 
             return "0" * 64  # No previous hash found
 
         except Exception:
             return "0" * 64  # Error reading ledger
 
-    def verify_meta_capsule(self, meta_capsule_id: str) -> Dict[str, Any]:
+    def verify_meta_capsule(
+        self, meta_capsule_id: str, ledger_index: Optional[Set[Tuple[str, str]]] = None
+    ) -> Dict[str, Any]:
         """Verify the integrity of a meta-capsule"""
         meta_capsule_file = self.meta_dir / f"{meta_capsule_id}.json"
 
@@ -616,35 +639,84 @@ class MetaCapsuleCreator:
         ):
             archive_file = Path(meta_capsule["archive_info"]["archive_file"])
             if archive_file.exists():
-                with open(archive_file, "rb") as f:
-                    archive_content = f.read()
-                    calculated_archive_hash = hashlib.sha256(
-                        archive_content
-                    ).hexdigest()
-                    verification_result["archive_valid"] = (
-                        calculated_archive_hash
-                        == meta_capsule["archive_info"]["archive_hash"]
-                    )
-                    verification_result["details"]["archive_hash_valid"] = (
-                        verification_result["archive_valid"]
-                    )
+                calculated_archive_hash = sha256_file(archive_file)
+                verification_result["archive_valid"] = (
+                    calculated_archive_hash
+                    == meta_capsule["archive_info"]["archive_hash"]
+                )
+                verification_result["details"]["archive_hash_valid"] = (
+                    verification_result["archive_valid"]
+                )
 
         # Verify ledger consistency
         if meta_capsule.get("ledger_update"):
             verification_result["ledger_consistent"] = self.verify_ledger_entry(
-                meta_capsule
+                meta_capsule, ledger_index
             )
 
         return verification_result
 
-    def verify_ledger_entry(self, meta_capsule: Dict[str, Any]) -> bool:
-        """Verify that the meta-capsule entry exists in the ledger"""
+    def load_ledger_index(self) -> Set[Tuple[str, str]]:
+        """Collect the ledger's (META_ID, META_HASH) pairs, reusing earlier reads"""
         if not self.ledger_file.exists():
-            return False
+            return set()
+
+        stat = self.ledger_file.stat()
+        cached = self._ledger_index_cache
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[4]
+
+        if cached and stat.st_size >= cached[2]:
+            # The ledger is append-only; resume after the last complete line
+            offset, index = cached[2], set(cached[3])
+        else:
+            offset, index = 0, set()
+
+        partial = set()
+        with open(self.ledger_file, "rb") as f:
+            f.seek(offset)
+            for raw in f:
+                # An unterminated last line is used now but re-read next time
+                target = index if raw.endswith(b"\n") else partial
+                if target is index:
+                    offset += len(raw)
+                # Cheap byte-level framing check before decoding and splitting
+                if b"|META_ID=" not in raw or b"|META_HASH=" not in raw:
+                    continue
+                line = raw.decode("utf-8")
+                fields = dict(
+                    field.partition("=")[::2] for field in line.rstrip("\n").split("|")
+                )
+                target.add((fields.get("META_ID"), fields.get("META_HASH")))
+
+        # Resuming starts from the complete lines only, but an unchanged ledger
+        # returns everything this scan found, unterminated last line included
+        result = index | partial if partial else index
+        self._ledger_index_cache = (
+            stat.st_mtime_ns,
+            stat.st_size,
+            offset,
+            index,
+            result,
+        )
+        return result
 
+    def verify_ledger_entry(
+        self,
+        meta_capsule: Dict[str, Any],
+        ledger_index: Optional[Set[Tuple[str, str]]] = None,
+    ) -> bool:
+        """Verify that the meta-capsule entry exists in the ledger"""
         meta_id = meta_capsule["meta_capsule_id"]
         meta_hash = meta_capsule["meta_hash"]
 
+        # Bulk verification passes a prebuilt index instead of rescanning
+        if ledger_index is not None:
+            return (meta_id, meta_hash) in ledger_index
+
+        if not self.ledger_file.exists():
+            return False
+
         with open(self.ledger_file, "r") as f:
             for line in f:
                 if f"META_ID={meta_id}" in line and f"META_HASH={meta_hash}" in line:
@@ -16,14 +16,14 @@ class PerformanceOptimizer:
     
     def cache_result(self, key: str, value: Any, ttl: int = 300) -> None:
         """Cache a result with TTL"""
-        expires = time.time() + ttl
+        expires = time.monotonic() + ttl
         self._cache[key] = (value, expires)
     
     def get_cached(self, key: str) -> Any:
         """Get cached result if not expired"""
         if key in self._cache:
             value, expires = self._cache[key]
-            if time.time() < expires:
+            if time.monotonic() < expires:
                 return value
             del self._cache[key]
         return None
@@ -44,6 +44,9 @@ class PerformanceOptimizer:
         avg = sum(self._metrics[operation]) / len(self._metrics[operation])
         if duration > avg * 2:
             self.logger.warning(
-                f"Performance degradation detected for {operation}. "
-                f"Duration: {duration:.2f}s, Avg: {avg:.2f}s"
+                "Performance degradation detected for %s. "
+                "Duration: %.2fs, Avg: %.2fs",
+                operation,
+                duration,
+                avg,
             )
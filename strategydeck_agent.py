@@ -26,6 +26,7 @@ from cycle_execution import CycleExecutor
 from policy_grants import PolicyManager, PolicyType
 from integration import EPOCH5Integration
 from ceiling_manager import CeilingManager, ServiceTier
+from enhanced_logging import EnhancedLogger
 
 # Mesh automation enhancements
 @dataclass
@@ -326,22 +327,15 @@ class StrategyDeckAgent:
         self.cache_dir = Path(cache_dir or ".cache")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
-        # Enhanced logging setup
+        # Enhanced logging setup; console and file writes run on a listener
+        # thread so logging on the task path never waits on disk I/O. Agents
+        # sharing a name reuse the logger instead of stacking queue handlers
         self.logger = logging.getLogger(self.name)
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            '[%(asctime)s] %(levelname)s %(name)s: %(message)s',
-            datefmt='%Y-%m-%dT%H:%M:%S%z'
-        )
-        handler.setFormatter(formatter)
-        if not self.logger.hasHandlers():
-            self.logger.addHandler(handler)
-            
-        # File handler for persistent logging
-        file_handler = logging.FileHandler(self.cache_dir / f"{name}.log")
-        file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
-        self.logger.setLevel(logging.INFO)
+        self.enhanced_logger = None
+        if not self.logger.handlers:
+            self.enhanced_logger = EnhancedLogger(
+                self.name, self.cache_dir, use_queue=True
+            )
         
         # Initialize automation mesh
         if enable_mesh:
@@ -508,7 +502,7 @@ class StrategyDeckAgent:
                 self.logger.info("Automation mesh initialized successfully")
 
             except Exception as e:
-                self.logger.error(f"Failed to initialize mesh nodes: {str(e)}")
+                self.logger.error("Failed to initialize mesh nodes: %s", e)
                 raise
 
         # Run setup
@@ -527,19 +521,25 @@ class StrategyDeckAgent:
 
             # Log optimization results
             self.logger.info(
-                f"Mesh optimization results:\n"
-                f"- Success Rate: {metrics.success_rate:.2%}\n"
-                f"- Resource Utilization: {metrics.resource_utilization:.2%}\n"
-                f"- Mesh Stability: {metrics.mesh_stability:.2%}\n"
-                f"- Quantum Efficiency: {metrics.quantum_efficiency:.2%}\n"
-                f"- Ethical Alignment: {metrics.ethical_alignment:.2%}\n"
-                f"- Cognitive Coherence: {metrics.cognitive_coherence:.2%}"
+                "Mesh optimization results:\n"
+                "- Success Rate: %.2f%%\n"
+                "- Resource Utilization: %.2f%%\n"
+                "- Mesh Stability: %.2f%%\n"
+                "- Quantum Efficiency: %.2f%%\n"
+                "- Ethical Alignment: %.2f%%\n"
+                "- Cognitive Coherence: %.2f%%",
+                metrics.success_rate * 100,
+                metrics.resource_utilization * 100,
+                metrics.mesh_stability * 100,
+                metrics.quantum_efficiency * 100,
+                metrics.ethical_alignment * 100,
+                metrics.cognitive_coherence * 100,
             )
 
             return metrics
 
         except Exception as e:
-            self.logger.error(f"Mesh optimization failed: {str(e)}")
+            self.logger.error("Mesh optimization failed: %s", e)
             raise
 
     async def execute_task_async(
@@ -562,8 +562,8 @@ class StrategyDeckAgent:
         # Check cache
         if cache_key in self._cache:
             cached_result, expiry = self._cache[cache_key]
-            if time.time() < expiry:
-                self.logger.info(f"Cache hit for task: {task_callable.__name__}")
+            if time.monotonic() < expiry:
+                self.logger.info("Cache hit for task: %s", task_callable.__name__)
                 return cached_result
                 
         # Ethical assessment of task
@@ -580,7 +580,7 @@ class StrategyDeckAgent:
             )
             
             if not ethical_assessment.constraints_satisfied:
-                self.logger.warning(f"Task {task_id} failed ethical assessment")
+                self.logger.warning("Task %s failed ethical assessment", task_id)
                 raise TaskExecutionError(
                     f"Task execution blocked: {', '.join(ethical_assessment.reasoning)}"
                 )
@@ -597,7 +597,9 @@ class StrategyDeckAgent:
             
             if impact.uncertainty > 0.8:
                 self.logger.warning(
-                    f"Task {task_id} has high uncertainty impact: {impact.uncertainty:.2f}"
+                    "Task %s has high uncertainty impact: %.2f",
+                    task_id,
+                    impact.uncertainty,
                 )
         
         # Cognitive processing of task context
@@ -626,7 +628,7 @@ class StrategyDeckAgent:
                 ]
             )
             
-            self.logger.info(f"Cognitive decision: {decision.reasoning_path}")
+            self.logger.info("Cognitive decision: %s", decision.reasoning_path)
             
             # Update emotional state based on decision confidence
             self.cognitive.update_emotional_state(
@@ -642,13 +644,13 @@ class StrategyDeckAgent:
                 cpu_usage=0.5,     # Placeholder
                 complexity_score=1.0
             )
-            self.logger.info(f"Predicted execution time: {predicted_time:.2f}s")
+            self.logger.info("Predicted execution time: %.2fs", predicted_time)
             
         # Check system health
         if hasattr(self, 'resilience'):
             health_report = self.resilience.get_health_report()
             if health_report["status"] != "Healthy":
-                self.logger.warning(f"System health degraded: {health_report}")
+                self.logger.warning("System health degraded: %s", health_report)
                 
         # Reach consensus if required
         if require_consensus and hasattr(self, 'collaboration'):
@@ -666,8 +668,12 @@ class StrategyDeckAgent:
                 
         # Temporal analysis and prediction
         if hasattr(self, 'temporal'):
-            # Update task performance time series
-            performance_history = np.array([t.execution_time for t in self._task_history])
+            # Update task performance time series (float32 matches the model input)
+            performance_history = np.fromiter(
+                (t.execution_time for t in self._task_history),
+                dtype=np.float32,
+                count=len(self._task_history),
+            )
             if len(performance_history) > 0:
                 self.temporal.add_time_series(
                     "task_performance",
@@ -683,9 +689,9 @@ class StrategyDeckAgent:
                 
                 # Log prediction insights
                 self.logger.info(
-                    f"Predicted future performance: "
-                    f"mean={prediction.predictions.mean():.2f}s, "
-                    f"confidence={prediction.model_performance['rmse']:.2f}"
+                    "Predicted future performance: mean=%.2fs, confidence=%.2f",
+                    prediction.predictions.mean(),
+                    prediction.model_performance["rmse"],
                 )
                 
                 # Detect temporal patterns
@@ -694,12 +700,12 @@ class StrategyDeckAgent:
                 )
                 if patterns.get("seasonality", {}).get("strongest_period"):
                     self.logger.info(
-                        f"Detected performance cycle: "
-                        f"{patterns['seasonality']['strongest_period']:.1f} tasks"
+                        "Detected performance cycle: %.1f tasks",
+                        patterns["seasonality"]["strongest_period"],
                     )
                 
-        start_time = time.time()
-        self.logger.info(f"Executing task {task_id}: {task_callable.__name__}")
+        start_time = time.perf_counter()
+        self.logger.info("Executing task %s: %s", task_id, task_callable.__name__)
         
         try:
             # Execute task in thread pool
@@ -711,7 +717,7 @@ class StrategyDeckAgent:
                 **kwargs
             )
             
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             task_result = TaskResult(
                 success=True,
                 result=result,
@@ -721,10 +727,10 @@ class StrategyDeckAgent:
             )
             
             # Cache successful results
-            self._cache[cache_key] = (task_result, time.time() + cache_ttl)
+            self._cache[cache_key] = (task_result, time.monotonic() + cache_ttl)
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             task_result = TaskResult(
                 success=False,
                 result=None,
@@ -733,7 +739,7 @@ class StrategyDeckAgent:
                 timestamp=datetime.utcnow().isoformat(),
                 error=str(e)
             )
-            self.logger.error(f"Task {task_id} failed: {e}")
+            self.logger.error("Task %s failed: %s", task_id, e)
             
         self._save_result(task_result)
         return task_result
@@ -804,3 +810,10 @@ class StrategyDeckAgent:
         """Clear task cache"""
         self._cache.clear()
         self.logger.info("Task cache cleared")
+
+    def shutdown(self) -> None:
+        """Stop the task executor and flush and close the agent's log handlers"""
+        self.executor.shutdown(wait=True)
+        if self.enhanced_logger is not None:
+            self.enhanced_logger.close()
+            self.enhanced_logger = None
@@ -83,7 +83,7 @@ class TestEPOCH5Integration:
         integration_system.log_integration_event(event_type, event_data)
 
         # Check that log file exists in the correct location
-        log_file = integration_system.base_dir / "integration_events.log"
+        log_file = integration_system.base_dir / "integration.log"
         assert log_file.exists()
 
     def test_validate_system_integrity_empty(self, integration_system):
@@ -0,0 +1,61 @@
+"""
+Tests for EPOCH5 meta-capsule system
+"""
+
+import pytest
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+try:
+    from meta_capsule import MetaCapsuleCreator
+except ImportError as e:
+    pytest.skip(f"Could not import meta_capsule module: {e}", allow_module_level=True)
+
+
+def ledger_line(meta_id, meta_hash):
+    """Build a ledger line in the format create_meta_capsule writes"""
+    return (
+        f"TIMESTAMP=2024-01-01T00:00:00Z|TYPE=META_CAPSULE|META_ID={meta_id}"
+        f"|META_HASH={meta_hash}|PREV_HASH=0|RECORD_HASH=0"
+    )
+
+
+class TestMetaCapsuleCreator:
+    """Test cases for MetaCapsuleCreator class"""
+
+    @pytest.fixture
+    def creator(self, temp_dir):
+        """Create a MetaCapsuleCreator instance for testing"""
+        return MetaCapsuleCreator(temp_dir)
+
+    def test_ledger_index_keeps_unterminated_line(self, creator):
+        """Test that repeated index loads keep an entry still missing its newline"""
+        with open(creator.ledger_file, "w") as f:
+            f.write(ledger_line("meta_1", "hash_1") + "\n")
+            f.write(ledger_line("meta_2", "hash_2"))
+
+        capsule = {"meta_capsule_id": "meta_2", "meta_hash": "hash_2"}
+        assert creator.verify_ledger_entry(capsule)
+
+        # The second load hits the unchanged-file fast path
+        assert ("meta_2", "hash_2") in creator.load_ledger_index()
+        index = creator.load_ledger_index()
+        assert index == {("meta_1", "hash_1"), ("meta_2", "hash_2")}
+        assert creator.verify_ledger_entry(capsule, index)
+
+    def test_ledger_index_resumes_after_append(self, creator):
+        """Test that an appended ledger is indexed from where the last load stopped"""
+        with open(creator.ledger_file, "w") as f:
+            f.write(ledger_line("meta_1", "hash_1"))
+        assert creator.load_ledger_index() == {("meta_1", "hash_1")}
+
+        with open(creator.ledger_file, "a") as f:
+            f.write("\n" + ledger_line("meta_2", "hash_2") + "\n")
+
+        assert creator.load_ledger_index() == {
+            ("meta_1", "hash_1"),
+            ("meta_2", "hash_2"),
+        }
@@ -15,7 +15,9 @@ def agent_manager(tmp_path):
 
 @pytest.fixture
 def enhanced_logger(tmp_path):
-    return EnhancedLogger("test_logger", tmp_path)
+    logger = EnhancedLogger("test_logger", tmp_path)
+    yield logger
+    logger.close()
 
 class TestSecurityIntegration:
     def test_secure_agent_session(self, security_manager, agent_manager):
@@ -48,3 +50,25 @@ class TestLoggingIntegration:
         log_file = Path(enhanced_logger.logger.handlers[0].baseFilename)
         assert log_file.exists(), "Log file should be created"
         assert log_file.stat().st_size > 0, "Log file should contain data"
+
+    def test_queued_logging_flushes_on_close(self, tmp_path):
+        logger = EnhancedLogger("test_queued_logger", tmp_path, use_queue=True)
+        logger.log_event("agent_created", {"did": "did:epoch5:test"})
+        logger.close()
+
+        log_file = tmp_path / "test_queued_logger.log"
+        assert "agent_created" in log_file.read_text(), (
+            "Queued record should be written"
+        )
+
+    def test_close_detaches_and_closes_handlers(self, tmp_path):
+        logger = EnhancedLogger("test_closed_logger", tmp_path, use_queue=True)
+        logger.log_event("agent_created", {"did": "did:epoch5:test"})
+        logger.close()
+
+        assert logger.logger.handlers == [], "Queue handler should be removed"
+        logger.logger.info("after close")
+        log_file = tmp_path / "test_closed_logger.log"
+        assert "after close" not in log_file.read_text(), (
+            "Closed logger should not write"
+        )